@@ -9,198 +9,163 @@ class ServiceTracerLogging(ServiceTracer):
     """Implementation of ServiceTracer that logs messages using Python's logging module."""
 
     def __init__(self):
+        super().__init__()
         self._logger = logging.getLogger("service-logger")
 
-    def info(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-             extra: dict = None, **kwargs):
+    def info(self, payload: object, checkpoint_id: Optional[str] = None,
+             extra: dict = None):
         """Logs an informational message.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger.
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.info(payload, *args, **kwargs, extra=extra)
+        self._logger.info(payload, extra=extra)
 
-    def debug(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-              extra: dict = None, **kwargs):
+    def debug(self, payload: object, checkpoint_id: Optional[str] = None,
+              extra: dict = None):
         """Logs a debug message.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.debug(payload, *args, **kwargs)
+        self._logger.debug(payload)
 
-    def warning(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                extra: dict = None, **kwargs):
+    def warning(self, payload: object, checkpoint_id: Optional[str] = None,
+                extra: dict = None):
         """Logs a warning message.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.warning(payload, *args, **kwargs, extra=extra)
+        self._logger.warning(payload, extra=extra)
 
-    def error(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-              extra: dict = None, **kwargs):
+    def error(self, payload: object, checkpoint_id: Optional[str] = None,
+              extra: dict = None):
         """Logs an error message.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.error(payload, *args, **kwargs, extra=extra)
+        self._logger.error(payload, extra=extra)
 
-    def critical(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                 extra: dict = None, **kwargs):
+    def critical(self, payload: object, checkpoint_id: Optional[str] = None,
+                 extra: dict = None):
         """Logs a critical error message.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.critical(payload, *args, **kwargs, extra=extra)
+        self._logger.critical(payload, extra=extra)
 
-    def func_error(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                   extra: dict = None, **kwargs):
+    def func_error(self, payload: object, checkpoint_id: Optional[str] = None,
+                   extra: dict = None):
         """Logs a function-related error message.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.error(payload, *args, **kwargs, extra=extra)
+        self._logger.error(payload, extra=extra)
 
-    def tech_error(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                   error: Exception = None, extra: dict = None, **kwargs):
+    def tech_error(self, payload: object, checkpoint_id: Optional[str] = None,
+                   error: Exception = None, extra: dict = None):
         """Logs a technical error message, optionally including an exception.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         error : Exception, optional
             The exception to include in the log, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         new_payload: str = str(payload)
         if error is not None:
             new_payload = new_payload + " " + str(error)
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.critical(new_payload, *args, **kwargs, extra=extra)
+        self._logger.critical(new_payload, extra=extra)
 
-    def report_start_external(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                              extra: dict = None, **kwargs):
+    def report_start_external(self, payload: object, checkpoint_id: Optional[str] = None,
+                              extra: dict = None):
         """Logs the start of an external process or interaction.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.info(payload, *args, **kwargs, extra=extra)
+        self._logger.info(payload, extra=extra)
 
-    def report_end_external(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                            extra: dict = None, **kwargs):
+    def report_end_external(self, payload: object, checkpoint_id: Optional[str] = None,
+                            extra: dict = None):
         """Logs the end of an external process or interaction.
 
         Parameters
         ----------
         payload : object
             The message or object to log.
-        args: tuple
-            Arguments to pass to the logger
         checkpoint_id : Optional[str], optional
             An identifier for the logging checkpoint, by default None.
         extra : dict, optional
-            Additional logging context, by default None.
-        kwargs : dict
-            Keyword arguments"""
+            Additional logging context, by default None."""
         extra = extra or {}
         extra['checkpoint_id'] = checkpoint_id or ''
         extra['transaction_id'] = 'service-logging'
-        self._logger.info(payload, *args, **kwargs, extra=extra)
+        self._logger.info(payload, extra=extra)
@@ -10,10 +10,11 @@ class TransactionalTracerLogging(TransactionalTracer):
     """Implementation of TransactionalTracer that logs messages using Python's logging module."""
 
     def __init__(self):
+        super().__init__()
         self._logger = logging.getLogger("transactional-tracer")
 
-    def info(self, payload: object, *args, transaction_id: Optional[str] = None,
-             checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def info(self, payload: object, transaction_id: Optional[str] = None,
+             checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs an informational message.
 
         Parameters
@@ -28,11 +29,11 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None."""
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.info(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.info(payload, extra=new_extra)
 
-    def debug(self, payload: object, *args, transaction_id: Optional[str] = None,
-              checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def debug(self, payload: object, transaction_id: Optional[str] = None,
+              checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs a debug message.
 
         Parameters
@@ -47,11 +48,11 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None.        """
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.debug(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.debug(payload, extra=new_extra)
 
-    def warning(self, payload: object, *args, transaction_id: Optional[str] = None,
-                checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def warning(self, payload: object, transaction_id: Optional[str] = None,
+                checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs a warning message.
 
         Parameters
@@ -66,11 +67,11 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None.        """
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.warning(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.warning(payload, extra=new_extra)
 
-    def error(self, payload: object, *args, transaction_id: Optional[str] = None,
-              checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def error(self, payload: object, transaction_id: Optional[str] = None,
+              checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs an error message.
 
         Parameters
@@ -85,11 +86,11 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None.        """
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.error(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.error(payload, extra=new_extra)
 
-    def critical(self, payload: object, *args, transaction_id: Optional[str] = None,
-                 checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def critical(self, payload: object, transaction_id: Optional[str] = None,
+                 checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs a critical error message.
 
         Parameters
@@ -104,11 +105,11 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None.        """
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.critical(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.critical(payload, extra=new_extra)
 
-    def func_error(self, payload: object, *args, transaction_id: Optional[str] = None,
-                   checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def func_error(self, payload: object, transaction_id: Optional[str] = None,
+                   checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs a function-related error message.
 
         Parameters
@@ -123,12 +124,12 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None.        """
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.error(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.error(payload, extra=new_extra)
 
-    def tech_error(self, payload: object, *args, transaction_id: Optional[str] = None,
-                   checkpoint_id: Optional[str] = None, error: Exception = None, extra: dict = None,
-                   **kwargs):
+    def tech_error(self, payload: object, transaction_id: Optional[str] = None,
+                   checkpoint_id: Optional[str] = None, error: Exception = None,
+                   extra: dict = None):
         """Logs a technical error message, optionally including an exception.
 
         Parameters
@@ -145,15 +146,15 @@ class TransactionalTracerLogging(TransactionalTracer):
             Captured error to be logged."""
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
+            new_extra = {**new_extra, **extra}
         error_payload = ""
         if isinstance(error, Exception):
             error_payload = ":" + str(error)
 
-        self._logger.critical(str(payload) + error_payload , *args, **kwargs, extra=new_extra)
+        self._logger.critical("%s%s", payload, error_payload, extra=new_extra)
 
-    def report_start_external(self, payload: object, *args, transaction_id: Optional[str] = None,
-                              checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def report_start_external(self, payload: object, transaction_id: Optional[str] = None,
+                              checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs the start of an external operation.
 
         Parameters
@@ -168,11 +169,11 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None."""
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.info(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.info(payload, extra=new_extra)
 
-    def report_end_external(self, payload: object, *args, transaction_id: Optional[str] = None,
-                            checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def report_end_external(self, payload: object, transaction_id: Optional[str] = None,
+                            checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs the end of an external operation.
 
         Parameters
@@ -187,5 +188,5 @@ class TransactionalTracerLogging(TransactionalTracer):
             Additional logging context, by default None."""
         new_extra = self._re_args_with_main(transaction_id, checkpoint_id)
         if extra:
-            new_extra.update(extra)
-        self._logger.info(payload, *args, **kwargs, extra=new_extra)
+            new_extra = {**new_extra, **extra}
+        self._logger.info(payload, extra=new_extra)
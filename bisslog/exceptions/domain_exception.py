@@ -22,6 +22,10 @@ class DomainException(Exception):
     --------
     >>> raise DomainException("error-key", "Error description")
     """
+    # Slot descriptors for the two known fields; exception instances still
+    # carry a __dict__ (BaseException provides one), so this only pins the
+    # field storage, it does not shrink instances.
+    __slots__ = ("keyname", "message")
     keyname: str
     message: str
 
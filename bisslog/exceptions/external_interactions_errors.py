@@ -98,3 +98,16 @@ class ProcessingExtException(InternalErrorExtException):
 
 class DeliveryExtException(OperationalErrorExtException):
     """Raised when a message or file cannot be delivered."""
+
+# Precomputed tuples for except clauses. Matching against a flat tuple of
+# concrete classes lets handlers on hot paths avoid walking the inheritance
+# chain above on every raise.
+EXT_OPERATIONAL = (ConnectionExtException, TimeoutExtException,
+                   AuthenticationExtException, AuthorizationExtException,
+                   DeliveryExtException)
+
+EXT_LEAVES = tuple(
+    cls for cls in list(globals().values())
+    if isinstance(cls, type) and issubclass(cls, ExternalInteractionError)
+    and not cls.__subclasses__()
+)
@@ -0,0 +1,125 @@
+"""Private module running the process-wide trace record dispatcher.
+
+All tracers share one daemon consumer thread: records carry the name of
+their destination sink and land on a single deque, so adding tracers to an
+application never adds threads, and the GIL contention and context
+switching stay those of one consumer. Sinks are registered by name with
+`register_sink`; records tagged with an unregistered name fall back to the
+default sink, a buffered writer on ``sys.stderr``."""
+import atexit
+import collections
+import threading
+from typing import Deque, Dict, List, Optional
+
+from .buffered_sink import BufferedBatchHandler, BufferedSink
+from .log_queue import QueueListener
+
+_BUF_MAXLEN = 16384
+
+DEFAULT_SINK = "default"
+
+# Module-level singleton state: one buffer, one sink table, one consumer
+# thread for the whole process.
+# pylint: disable=invalid-name
+_buf: Deque = collections.deque(maxlen=_BUF_MAXLEN)
+_wake = threading.Event()
+_sinks: Dict[str, BufferedBatchHandler] = {}
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+_dropped_records = 0
+# pylint: enable=invalid-name
+
+
+class _DispatchHandler:  # pylint: disable=too-few-public-methods
+    """Batch handler routing each drained batch to its tagged sinks.
+
+    Records within a batch are grouped by sink name, so each registered
+    handler still receives its records as one contiguous batch."""
+
+    def handle_batch(self, records: List[tuple]):
+        """Groups a drained batch by sink name and forwards each group.
+
+        Parameters
+        ----------
+        records : List[tuple]
+            The ``(sink_name, ts_ns, line_bytes)`` records drained from
+            the shared buffer."""
+        grouped: Dict[str, list] = {}
+        for name, ts_ns, line in records:
+            grouped.setdefault(name, []).append((ts_ns, line))
+        sinks = _sinks
+        default = sinks[DEFAULT_SINK]
+        for name, group in grouped.items():
+            sinks.get(name, default).handle_batch(group)
+
+
+def register_sink(name: str, writer) -> str:
+    """Registers a writer as a named sink of the shared dispatcher.
+
+    The first registration under a name wins; repeated calls with the
+    same name are no-ops, so tracer instances may register on every
+    construction without churning the sink table.
+
+    Parameters
+    ----------
+    name : str
+        The sink name records are tagged with.
+    writer : object
+        An object exposing ``write(bytes)``, typically a `BufferedSink`.
+
+    Returns
+    -------
+    str
+        The registered name, for convenience."""
+    with _lock:
+        if name not in _sinks:
+            _sinks[name] = BufferedBatchHandler(writer)
+    return name
+
+
+def _ensure_listener() -> QueueListener:
+    """Starts the process-wide consumer thread once, on first use.
+
+    The listener is stopped at interpreter exit, draining the records
+    still buffered — typically the final events of a crashing process —
+    before the sinks flush their own buffers.
+
+    Returns
+    -------
+    QueueListener
+        The single listener draining the shared buffer for all tracers."""
+    global _listener  # pylint: disable=global-statement
+    if _listener is None:
+        with _lock:
+            if _listener is None:
+                _sinks.setdefault(DEFAULT_SINK, BufferedBatchHandler(BufferedSink()))
+                listener = QueueListener(_buf, _wake, _DispatchHandler())
+                listener.start()
+                atexit.register(listener.stop)
+                _listener = listener
+    return _listener
+
+
+def enqueue(record: tuple) -> bool:
+    """Appends a tagged record on the shared buffer without blocking.
+
+    When the buffer is full the record is dropped and counted instead of
+    evicting older records or blocking the producing thread.
+
+    Parameters
+    ----------
+    record : tuple
+        The ``(sink_name, ts_ns, line_bytes)`` record to enqueue.
+
+    Returns
+    -------
+    bool
+        True if the record was enqueued, False if it was dropped."""
+    global _dropped_records  # pylint: disable=global-statement
+    _ensure_listener()
+    if len(_buf) >= _BUF_MAXLEN:
+        _dropped_records += 1
+        return False
+    _buf.append(record)
+    _wake.set()
+    return True
@@ -0,0 +1,131 @@
+"""Module providing the building blocks of the asynchronous trace queue.
+
+Tracer methods append lightweight records instead of writing to their sink
+directly: the timestamp is an integer `time.time_ns()` count — formatting
+is deferred to the consumer — and the remaining fields are serialized to
+one JSON line at the producer (with `orjson` when installed), so the
+consumer thread concatenates opaque bytes without re-traversing Python
+objects built by another thread. The `QueueListener` defined here drains
+such a buffer on a background thread, so the threads producing trace
+events never block on I/O; the process-wide instance shared by all
+tracers lives in `_dispatcher`.
+
+Since only one consumer thread drains the buffer, a plain
+`collections.deque` plus a `threading.Event` is enough: `append` and
+`popleft` are atomic under CPython, which removes the lock acquisition and
+condition-variable notification that `queue.Queue` pays on every event."""
+import threading
+from typing import Deque, Optional
+
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj, default=str)  # pylint: disable=no-member
+except ImportError:
+    import json
+
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, default=str).encode("utf-8")
+
+_BATCH_MAX = 256
+
+
+class QueueListener:
+    """Background consumer that drains the record buffer in batches.
+
+    The listener thread sleeps on an event until a producer signals it,
+    then drains the deque, coalescing up to ``batch_max`` pending records
+    per ``handler.handle_batch`` call, collapsing per-event writes into
+    batched ones.
+
+    Parameters
+    ----------
+    buffer : collections.deque
+        The deque holding the records to consume.
+    wake : threading.Event
+        Event set by producers whenever a record is appended.
+    handler : object
+        Object exposing ``handle_batch(records)``, receiving each drained
+        batch.
+    batch_max : int, optional
+        Maximum number of records coalesced per batch."""
+
+    _SENTINEL = None
+
+    def __init__(self, buffer: Deque, wake: threading.Event, handler,
+                 batch_max: int = _BATCH_MAX):
+        self._buf = buffer
+        self._wake = wake
+        self._handler = handler
+        self._batch_max = batch_max
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Starts the daemon thread draining the buffer."""
+        self._thread = threading.Thread(target=self._monitor,
+                                        name="bisslog-trace-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the listener after draining the records already buffered."""
+        self._buf.append(self._SENTINEL)
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _monitor(self):
+        """Drains the buffer, coalescing pending records into batches.
+
+        A raising handler must not kill the consumer thread — it is shared
+        by every tracer in the process — so batches that fail (a closed
+        stream at teardown, a bad file descriptor) are discarded and the
+        loop keeps draining."""
+        buf = self._buf
+        wake = self._wake
+        stopped = False
+        while not stopped:
+            wake.wait()
+            wake.clear()
+            while buf and not stopped:
+                batch = []
+                while buf and len(batch) < self._batch_max:
+                    record = buf.popleft()
+                    if record is self._SENTINEL:
+                        stopped = True
+                        break
+                    batch.append(record)
+                if batch:
+                    try:
+                        self._handler.handle_batch(batch)
+                    except Exception:  # pylint: disable=broad-except
+                        continue
+
+
+def encode_record(level: int, transaction_id: Optional[str], checkpoint_id: Optional[str],
+                  payload: object, extra: Optional[dict]) -> bytes:
+    """Serializes a record into one JSON line of bytes.
+
+    Encoding happens on the producing thread, where the objects are hot in
+    cache; non-serializable payloads fall back to ``str``.
+
+    Parameters
+    ----------
+    level : int
+        The severity level of the record.
+    transaction_id : Optional[str]
+        The transaction ID associated with the record.
+    checkpoint_id : Optional[str]
+        The checkpoint identifier of the record.
+    payload : object
+        The data or message to be logged.
+    extra : Optional[dict]
+        Additional metadata for tracing.
+
+    Returns
+    -------
+    bytes
+        The encoded record, terminated by a newline."""
+    return _dumps({"lvl": level, "tid": transaction_id, "ckpt": checkpoint_id,
+                   "p": payload, "extra": extra}) + b"\n"
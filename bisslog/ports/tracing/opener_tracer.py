@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 
 from typing import Optional
 
+_NOT_IMPL = NotImplementedError("TracingOpener method not implemented")
+
 
 class OpenerTracer(ABC):
     """Abstract base class for tracing the start and end of transactions.
@@ -24,7 +26,7 @@ class OpenerTracer(ABC):
             The name of the component initiating the transaction.
         super_transaction_id : str, optional
             The identifier of a parent transaction, if applicable."""
-        raise NotImplementedError("TracingOpener must implement start")
+        raise _NOT_IMPL
 
     @abstractmethod
     def end(self, *args, transaction_id: Optional[str], component: str,
@@ -41,4 +43,4 @@ class OpenerTracer(ABC):
             The identifier of a parent transaction, if applicable.
         result : object, optional
             The result or output of the transaction, if any."""
-        raise NotImplementedError("TracingOpener must implement end")
+        raise _NOT_IMPL
@@ -1,25 +1,67 @@
 """Module defining the ServiceTracer interface."""
 
-from abc import ABC, abstractmethod
+import time
 from typing import Optional
 
-from .tracer import Tracer
+from . import _dispatcher, log_queue
+from .tracer import (LEVEL_CRITICAL, LEVEL_DEBUG, LEVEL_ERROR, LEVEL_INFO,
+                     LEVEL_WARNING, Tracer)
 
+_time_ns = time.time_ns
 
-class ServiceTracer(Tracer, ABC):
-    """Abstract base class for service tracing.
 
-    This class extends `Tracer` and defines a contract for implementing
-    service-level tracing mechanisms.
+class ServiceTracer(Tracer):
+    """Base class for service tracing.
+
+    This class extends `Tracer` and provides a default asynchronous
+    implementation for service-level tracing: every public method delegates
+    to `_log` with a pre-interned level constant, which builds a lightweight
+    record and enqueues it on the shared log queue, leaving the actual
+    writing to a background batching thread.
 
     Notes
     -----
-    - This class is intended to be subclassed by specific service tracing implementations.
-    - It does not define any concrete methods but serves as a structural base."""
+    - Records below `_min_level` are discarded before any per-call work.
+    - Subclasses may override any method to integrate a concrete sink
+      synchronously, as the logging adapters do.
+    - Instances carry no `__dict__`; subclasses should declare `__slots__`
+      to keep that benefit."""
+
+    __slots__ = ()
+
+    _min_level = LEVEL_DEBUG
+
+    def _log(self, level: int, payload: object, checkpoint_id: Optional[str] = None,
+             extra: dict = None):
+        """Builds a record for the given level and enqueues it.
 
-    @abstractmethod
-    def info(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-             extra: dict = None, **kwargs):
+        The record fields are serialized to one JSON line here, on the
+        producing thread, so the consumer only handles opaque bytes. The
+        timestamp is kept as an integer nanosecond count and rendered by
+        the consumer, once per batch at second granularity. Records are
+        tagged with the class name; the shared dispatcher routes them to a
+        sink registered under that name, or to its default sink.
+
+        Parameters
+        ----------
+        level : int
+            The severity level of the record.
+        payload : object
+            The data or message to be logged.
+        checkpoint_id : str, optional
+            An identifier for the tracing checkpoint.
+        extra : dict, optional
+            Additional logging context, by default None."""
+        if level < self._min_level:
+            return
+        if not self._admit(level, payload, checkpoint_id):
+            return
+        _dispatcher.enqueue((self.__class__.__name__, _time_ns(),
+                             log_queue.encode_record(level, None, checkpoint_id,
+                                                     payload, extra)))
+
+    def info(self, payload: object, checkpoint_id: Optional[str] = None,
+             extra: dict = None):
         """Logs an informational message.
 
         Parameters
@@ -30,13 +72,16 @@ class ServiceTracer(Tracer, ABC):
             An identifier for the tracing checkpoint.
         extra : dict, optional
             Additional logging context, by default None."""
-        raise NotImplementedError("TracingManager must implement method info")
+        return self._log(LEVEL_INFO, payload, checkpoint_id, extra)
 
-    @abstractmethod
-    def debug(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-              extra: dict = None, **kwargs):
+    def debug(self, payload: object, checkpoint_id: Optional[str] = None,
+              extra: dict = None):
         """Logs a debug message.
 
+        When `_dbg_sample_mask` is set to ``2**k - 1``, only one of every
+        ``2**k`` calls is kept; the rest return before any record is built
+        or enqueued. Sampling is disabled by default (mask 0).
+
         Parameters
         ----------
         payload : object
@@ -45,11 +90,12 @@ class ServiceTracer(Tracer, ABC):
             An identifier for the tracing checkpoint.
         extra : dict, optional
             Additional context information for debugging."""
-        raise NotImplementedError("TracingManager must implement method debug")
+        if not self._sample_debug():
+            return None
+        return self._log(LEVEL_DEBUG, payload, checkpoint_id, extra)
 
-    @abstractmethod
-    def warning(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                extra: dict = None, **kwargs):
+    def warning(self, payload: object, checkpoint_id: Optional[str] = None,
+                extra: dict = None):
         """Logs a warning message.
 
         Parameters
@@ -60,11 +106,10 @@ class ServiceTracer(Tracer, ABC):
             An identifier for the tracing checkpoint.
         extra : dict, optional
             Additional context information for debugging."""
-        raise NotImplementedError("TracingManager must implement method warning")
+        return self._log(LEVEL_WARNING, payload, checkpoint_id, extra)
 
-    @abstractmethod
-    def error(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-              extra: dict = None, **kwargs):
+    def error(self, payload: object, checkpoint_id: Optional[str] = None,
+              extra: dict = None):
         """Logs an error message.
 
         Parameters
@@ -75,11 +120,10 @@ class ServiceTracer(Tracer, ABC):
             An identifier for the tracing checkpoint.
         extra : dict, optional
             Additional context information for debugging."""
-        raise NotImplementedError("TracingManager must implement method error")
+        return self._log(LEVEL_ERROR, payload, checkpoint_id, extra)
 
-    @abstractmethod
-    def critical(self, payload: object, *args, checkpoint_id: Optional[str] = None,
-                 extra: dict = None, **kwargs):
+    def critical(self, payload: object, checkpoint_id: Optional[str] = None,
+                 extra: dict = None):
         """Logs a critical error message.
 
         Parameters
@@ -90,4 +134,4 @@ class ServiceTracer(Tracer, ABC):
             An identifier for the tracing checkpoint.
         extra : dict, optional
             Additional context information for debugging."""
-        raise NotImplementedError("TracingManager must implement method critical")
+        return self._log(LEVEL_CRITICAL, payload, checkpoint_id, extra)
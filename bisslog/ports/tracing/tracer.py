@@ -1,10 +1,117 @@
-"""Module defining the abstract Tracer class for logging and tracing."""
+"""Module defining the base Tracer class for logging and tracing."""
 
-from abc import ABC
+import time
+from collections import OrderedDict
+from typing import Optional
 
+LEVEL_DEBUG = 10
+LEVEL_INFO = 20
+LEVEL_WARNING = 30
+LEVEL_ERROR = 40
+LEVEL_CRITICAL = 50
 
-class Tracer(ABC):
-    """Abstract base class for logging and tracing events.
+_HASHABLE_PAYLOADS = (str, int, float, bool, type(None))
+
+
+class Tracer:  # pylint: disable=too-few-public-methods
+    """Base class for logging and tracing events.
 
     This class defines methods for logging information, debugging, warnings,
-    errors, and critical issues, ensuring a consistent tracing mechanism."""
+    errors, and critical issues, ensuring a consistent tracing mechanism.
+
+    It also provides the producer-side filters shared by the tracer bases:
+    a token-bucket rate limit (`_rate_limit` records per second, bursting up
+    to `_rate_burst`) and a duplicate-suppression window of `_dedup_window`
+    seconds, both applied before any record is allocated or enqueued.
+
+    The tracer bases declare `__slots__`, so instances are `__dict__`-free
+    and attribute access resolves through slot descriptors; subclasses must
+    also declare `__slots__` (empty or with their own fields) to keep that
+    property — ones that do not simply fall back to carrying a dict, as
+    the logging adapters do."""
+
+    __slots__ = ("_dbg_ctr", "_bucket_tokens", "_bucket_last", "_recent")
+
+    _rate_limit = 1000.0
+    _rate_burst = 1000.0
+    _dedup_window = 5.0
+    _dedup_max_entries = 1024
+    _dbg_sample_mask = 0
+
+    def __init__(self):
+        """Initializes the producer-side filter state.
+
+        The token bucket starts full and the duplicate-suppression table
+        empty; `_admit` still tolerates missing state, so subclasses that
+        define their own ``__init__`` without calling ``super().__init__()``
+        keep working."""
+        self._dbg_ctr = 0
+        self._bucket_tokens = self._rate_burst
+        self._bucket_last = time.monotonic()
+        self._recent = OrderedDict()
+
+    def _sample_debug(self) -> bool:
+        """Decides whether the current debug call is kept by the sampler.
+
+        When `_dbg_sample_mask` is set to ``2**k - 1``, only one of every
+        ``2**k`` calls is kept. Sampling is disabled by default (mask 0),
+        in which case every call is kept without touching the counter.
+
+        Returns
+        -------
+        bool
+            True when the call may proceed, False when it is sampled out."""
+        mask = self._dbg_sample_mask
+        if not mask:
+            return True
+        count = self._dbg_ctr = (getattr(self, "_dbg_ctr", 0) + 1) & 0x7FFFFFFF
+        return not count & mask
+
+    def _admit(self, level: int, payload: object, checkpoint_id: Optional[str]) -> bool:
+        """Decides whether a record may be built and enqueued.
+
+        Refills the token bucket from the elapsed time, rejecting the call
+        when no token is available, then collapses records identical in
+        level, checkpoint and payload seen within the suppression window.
+        Only scalar payloads take part in deduplication; structured
+        payloads (dicts, lists, exceptions) are distinct records by
+        assumption and pass through rate-limited only.
+
+        Parameters
+        ----------
+        level : int
+            The severity level of the record.
+        payload : object
+            The data or message to be logged.
+        checkpoint_id : Optional[str]
+            An identifier for the tracing checkpoint.
+
+        Returns
+        -------
+        bool
+            True when the record may proceed, False when it is filtered."""
+        now = time.monotonic()
+        tokens = getattr(self, "_bucket_tokens", None)
+        if tokens is None:
+            tokens = self._rate_burst
+            self._bucket_last = now
+            self._recent = OrderedDict()
+        tokens = min(self._rate_burst, tokens + (now - self._bucket_last) * self._rate_limit)
+        self._bucket_last = now
+        if tokens < 1.0:
+            self._bucket_tokens = tokens
+            return False
+        self._bucket_tokens = tokens - 1.0
+
+        if not isinstance(payload, _HASHABLE_PAYLOADS):
+            return True
+        key = hash((level, checkpoint_id, payload))
+        recent = self._recent
+        last_seen = recent.get(key)
+        if last_seen is not None and now - last_seen < self._dedup_window:
+            return False
+        recent[key] = now
+        recent.move_to_end(key)
+        if len(recent) > self._dedup_max_entries:
+            recent.popitem(last=False)
+        return True
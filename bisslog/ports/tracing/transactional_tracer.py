@@ -1,35 +1,137 @@
 """Module defining the base class for transactional tracing."""
 
-from abc import abstractmethod, ABC
-from typing import Optional
-
-from ...ports.tracing.tracer import Tracer
-from ...transactional.transaction_manager import TransactionManager, transaction_manager
-
-
-class TransactionalTracer(Tracer, ABC):
-    """Abstract base class for transactional tracing.
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from . import _dispatcher, log_queue
+from ...ports.tracing.tracer import (LEVEL_CRITICAL, LEVEL_DEBUG, LEVEL_ERROR,
+                                     LEVEL_INFO, LEVEL_WARNING, Tracer)
+
+if TYPE_CHECKING:
+    from ...transactional.transaction_manager import TransactionManager
+
+_time_ns = time.time_ns
+_tls = threading.local()
+
+
+@lru_cache(maxsize=256)
+def _empty_checkpoint_args(transaction_id: Optional[str]) -> dict:
+    """Returns the args dict for a transaction without a checkpoint.
+
+    Cached per transaction id so the steady-state path of a traced request
+    reuses one dict instead of allocating a fresh one per event. The result
+    is shared and must be treated as immutable by callers.
+
+    Parameters
+    ----------
+    transaction_id : Optional[str]
+        The transaction ID the args belong to.
+
+    Returns
+    -------
+    dict
+        A dictionary containing `transaction_id` and an empty `checkpoint_id`."""
+    return {"transaction_id": transaction_id, "checkpoint_id": ""}
+
+
+
+def _compile_fmt_log(fmt: str):
+    """Compiles a `_log` specialized for a fixed %-style format template.
+
+    The generated function keeps the level gate and producer filters but
+    renders the line inline and writes the encoded bytes straight to the
+    instance's ``_sink``, skipping the generic record build and the queue
+    handoff. Compiled once per subclass, so the per-event path is
+    straight-line bytecode without format-template lookups.
+
+    Parameters
+    ----------
+    fmt : str
+        %-style template using the fields ``ts``, ``lvl``, ``tid``,
+        ``ckpt`` and ``p``.
+
+    Returns
+    -------
+    callable
+        The specialized `_log` implementation."""
+    src = (
+        "def _log(self, level, payload, transaction_id=None, checkpoint_id=None, extra=None):\n"
+        "    if level < self._min_level:\n"
+        "        return None\n"
+        "    if not self._admit(level, payload, checkpoint_id):\n"
+        "        return None\n"
+        "    args = self._re_args_with_main(transaction_id, checkpoint_id)\n"
+        f"    return self._sink.write(({fmt!r} % {{\n"
+        "        'ts': time.time_ns(), 'lvl': level,\n"
+        "        'tid': args['transaction_id'], 'ckpt': args['checkpoint_id'],\n"
+        "        'p': payload}).encode('utf-8'))\n"
+    )
+    namespace = {"time": time}
+    exec(compile(src, "<bisslog-fmt-log>", "exec"), namespace)  # pylint: disable=exec-used
+    return namespace["_log"]
+
+
+class TransactionalTracer(Tracer):
+    """Base class for transactional tracing.
 
     This class extends `Tracer` and provides utility methods for managing
-    transaction identifiers and checkpoints. It ensures that all tracing
-    implementations handle transactional context correctly."""
-
-    @property
-    def _transaction_manager(self) -> TransactionManager:
-        """Provides access to the transaction manager instance.
-
-        Returns
-        -------
-        TransactionManager
-            The singleton instance of the transaction manager."""
-        return transaction_manager
+    transaction identifiers and checkpoints, along with a default
+    asynchronous implementation: each method builds a lightweight record
+    carrying the transactional context and enqueues it on the shared log
+    queue, leaving the actual writing to a background batching thread.
+
+    Subclasses may override any method to integrate a concrete sink
+    synchronously, as the logging adapters do. Subclasses defining their
+    own `__init__` must call ``super().__init__()`` so the transaction
+    manager is bound. Instances carry no `__dict__` (`_tm` and the `_sink`
+    of format-specialized subclasses live in slots); subclasses should
+    declare `__slots__` to keep that benefit."""
+
+    __slots__ = ("_tm", "_sink")
+
+    _min_level = LEVEL_DEBUG
+    _FMT: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Specializes `_log` for subclasses declaring a `_FMT` template.
+
+        Subclasses that set `_FMT` (and bind a buffered ``_sink`` on their
+        instances) get a `_log` generated by `_compile_fmt_log`, writing
+        pre-formatted bytes synchronously to their own sink."""
+        super().__init_subclass__(**kwargs)
+        fmt = cls.__dict__.get("_FMT")
+        if fmt:
+            cls._log = _compile_fmt_log(fmt)
+
+    def __init__(self):
+        """Binds the transaction manager singleton once, so the hot path
+        reads a plain instance attribute instead of going through a
+        descriptor on every traced event.
+
+        The manager is imported here, lazily, so loading the tracer port
+        does not drag the transactional machinery in at import time.
+
+        Subclasses that bind a ``_sink`` before calling
+        ``super().__init__()`` get it registered on the shared dispatcher
+        under the class name, so their enqueued records are routed to it
+        by the single process-wide consumer thread."""
+        super().__init__()
+        # pylint: disable=import-outside-toplevel
+        from ...transactional.transaction_manager import transaction_manager
+        self._tm: "TransactionManager" = transaction_manager
+        sink = getattr(self, "_sink", None)
+        if sink is not None:
+            _dispatcher.register_sink(type(self).__name__, sink)
 
     def _re_args_with_main(self, transaction_id: Optional[str] = None,
                            checkpoint_id: Optional[str] = None) -> dict:
         """Constructs a dictionary containing the main transaction ID and checkpoint ID.
 
         If the transaction ID is not provided, it retrieves the main transaction ID
-        from the transaction manager.
+        from the transaction manager, or leaves it as None when the current
+        thread has no active transactional context.
 
         Parameters
         ----------
@@ -41,19 +143,29 @@ class TransactionalTracer(Tracer, ABC):
         Returns
         -------
         dict
-            A dictionary containing `transaction_id` and `checkpoint_id`."""
-        if transaction_id is None:
-            transaction_id = self._transaction_manager.get_main_transaction_id()
+            A dictionary containing `transaction_id` and `checkpoint_id`.
+            The dictionary may be cached and shared between calls of the
+            same thread, so callers must treat it as immutable and copy it
+            before merging other values in."""
+        if transaction_id is None and self._tm.has_context():
+            transaction_id = self._tm.get_main_transaction_id()
         if checkpoint_id is None or not checkpoint_id:
-            checkpoint_id = ""
-        return {"transaction_id": transaction_id, "checkpoint_id": checkpoint_id}
+            return _empty_checkpoint_args(transaction_id)
+        cached = getattr(_tls, "main_args", None)
+        if (cached is not None and cached["transaction_id"] is transaction_id
+                and cached["checkpoint_id"] == checkpoint_id):
+            return cached
+        args = {"transaction_id": transaction_id, "checkpoint_id": checkpoint_id}
+        _tls.main_args = args
+        return args
 
     def _re_args_with_current(self, transaction_id: Optional[str] = None,
                               checkpoint_id: Optional[str] = None) -> dict:
         """Constructs a dictionary containing the current transaction ID and checkpoint ID.
 
         If the transaction ID is not provided, it retrieves the current transaction ID
-        from the transaction manager.
+        from the transaction manager, or leaves it as None when the current
+        thread has no active transactional context.
 
         Parameters
         ----------
@@ -65,50 +177,81 @@ class TransactionalTracer(Tracer, ABC):
         Returns
         -------
         dict
-            A dictionary containing `transaction_id` and `checkpoint_id`."""
-        if transaction_id is None:
-            transaction_id = self._transaction_manager.get_transaction_id()
+            A dictionary containing `transaction_id` and `checkpoint_id`.
+            The dictionary may be cached and shared between calls of the
+            same thread, so callers must treat it as immutable and copy it
+            before merging other values in."""
+        if transaction_id is None and self._tm.has_context():
+            transaction_id = self._tm.get_transaction_id()
         if checkpoint_id is None or not checkpoint_id:
-            checkpoint_id = ""
-        return {"transaction_id": transaction_id, "checkpoint_id": checkpoint_id}
+            return _empty_checkpoint_args(transaction_id)
+        cached = getattr(_tls, "cur_args", None)
+        if (cached is not None and cached["transaction_id"] is transaction_id
+                and cached["checkpoint_id"] == checkpoint_id):
+            return cached
+        args = {"transaction_id": transaction_id, "checkpoint_id": checkpoint_id}
+        _tls.cur_args = args
+        return args
+
+    def _log(self, level: int, payload: object, transaction_id: Optional[str] = None,
+             checkpoint_id: Optional[str] = None, extra: dict = None):
+        """Builds a record with the transactional context and enqueues it.
+
+        Records below `_min_level` are discarded before any per-call work.
+        The record fields are serialized to one JSON line here, on the
+        producing thread, so the consumer only handles opaque bytes. The
+        timestamp is kept as an integer nanosecond count and rendered by
+        the consumer, once per batch at second granularity. Records are
+        tagged with the class name; the shared dispatcher routes them to a
+        sink registered under that name, or to its default sink.
 
-    @abstractmethod
-    def func_error(self, payload: object, *args, transaction_id: Optional[str] = None,
-                   checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+        Parameters
+        ----------
+        level : int
+            The severity level of the record.
+        payload : object
+            The data or message to be logged.
+        transaction_id : Optional[str]
+            The transaction ID associated with the record.
+        checkpoint_id : Optional[str]
+            The checkpoint identifier of the record.
+        extra : dict, optional
+            Additional metadata for tracing."""
+        if level < self._min_level:
+            return None
+        if not self._admit(level, payload, checkpoint_id):
+            return None
+        args = self._re_args_with_main(transaction_id, checkpoint_id)
+        return _dispatcher.enqueue((self.__class__.__name__, _time_ns(),
+                                    log_queue.encode_record(level, args["transaction_id"],
+                                                            args["checkpoint_id"],
+                                                            payload, extra)))
+
+    def func_error(self, payload: object, transaction_id: Optional[str] = None,
+                   checkpoint_id: Optional[str] = None, extra: dict = None):
         """Reports a functional error in the tracing system.
 
-        This method must be implemented by subclasses to log functional errors.
-
         Parameters
         ----------
         payload : object
             The error payload containing relevant data.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             The transaction ID associated with the error.
         checkpoint_id : Optional[str], optional
             The checkpoint where the error occurred.
         extra : dict, optional
-            Additional metadata for tracing.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method func_error")
-
-    @abstractmethod
-    def tech_error(self, payload: object, *args, transaction_id: Optional[str] = None,
-                   checkpoint_id: Optional[str] = None, error: Exception = None, extra: dict = None,
-                   **kwargs):
-        """Reports a technical error in the tracing system.
+            Additional metadata for tracing."""
+        return self._log(LEVEL_ERROR, payload, transaction_id, checkpoint_id, extra)
 
-        This method must be implemented by subclasses to log technical errors.
+    def tech_error(self, payload: object, transaction_id: Optional[str] = None,
+                   checkpoint_id: Optional[str] = None, error: Exception = None,
+                   extra: dict = None):
+        """Reports a technical error in the tracing system.
 
         Parameters
         ----------
         payload : object
             The error payload containing relevant data.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             The transaction ID associated with the error.
         checkpoint_id : Optional[str], optional
@@ -116,161 +259,125 @@ class TransactionalTracer(Tracer, ABC):
         extra : dict, optional
             Additional metadata for tracing.
         error: Exception
-            Captured error to be logged.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method tech_error")
-
-    @abstractmethod
-    def report_start_external(self, payload: object, *args, transaction_id: Optional[str] = None,
-                              checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
-        """Reports the start of an external process in the tracing system.
+            Captured error to be logged."""
+        if error is not None:
+            payload = f"{payload}: {error}"
+        return self._log(LEVEL_CRITICAL, payload, transaction_id, checkpoint_id, extra)
 
-        This method must be implemented by subclasses to log the start of an
-        external interaction.
+    def report_start_external(self, payload: object, transaction_id: Optional[str] = None,
+                              checkpoint_id: Optional[str] = None, extra: dict = None):
+        """Reports the start of an external process in the tracing system.
 
         Parameters
         ----------
         payload : object
             The payload containing relevant data about the external process.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             The transaction ID associated with the external process.
         checkpoint_id : Optional[str], optional
             The checkpoint where the external process started.
         extra : dict, optional
-            Additional metadata for tracing.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method report_start_external")
+            Additional metadata for tracing."""
+        return self._log(LEVEL_INFO, payload, transaction_id, checkpoint_id, extra)
 
-    @abstractmethod
-    def report_end_external(self, payload: object, *args, transaction_id: Optional[str] = None,
-                            checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def report_end_external(self, payload: object, transaction_id: Optional[str] = None,
+                            checkpoint_id: Optional[str] = None, extra: dict = None):
         """Reports the end of an external process in the tracing system.
 
-        This method must be implemented by subclasses to log the completion of an
-        external interaction.
-
         Parameters
         ----------
         payload : object
             The payload containing relevant data about the external process.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             The transaction ID associated with the external process.
         checkpoint_id : Optional[str], optional
             The checkpoint where the external process ended.
         extra : dict, optional
-            Additional metadata for tracing.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method report_end_external")
+            Additional metadata for tracing."""
+        return self._log(LEVEL_INFO, payload, transaction_id, checkpoint_id, extra)
 
-
-    @abstractmethod
-    def info(self, payload: object, *args, transaction_id: Optional[str] = None,
-             checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def info(self, payload: object, transaction_id: Optional[str] = None,
+             checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs an informational message.
 
         Parameters
         ----------
         payload : object
             The data or message to be logged.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             An identifier for the transaction, by default None.
         checkpoint_id : str, optional
             An identifier for the tracing checkpoint.
         extra : dict, optional
-            Additional context information for debugging.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method info")
-
-    @abstractmethod
-    def debug(self, payload: object, *args, transaction_id: Optional[str] = None,
-                 checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+            Additional context information for debugging."""
+        return self._log(LEVEL_INFO, payload, transaction_id, checkpoint_id, extra)
+
+    def debug(self, payload: object, transaction_id: Optional[str] = None,
+              checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs a debug message.
 
+        When `_dbg_sample_mask` is set to ``2**k - 1``, only one of every
+        ``2**k`` calls is kept; the rest return before any record is built
+        or enqueued. Sampling is disabled by default (mask 0).
+
         Parameters
         ----------
         payload : object
             The data or message to be logged.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             An identifier for the transaction, by default None.
         checkpoint_id : str, optional
             An identifier for the tracing checkpoint.
         extra : dict, optional
-            Additional context information for debugging.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method debug")
-
-    @abstractmethod
-    def warning(self, payload: object, *args, transaction_id: Optional[str] = None,
-                 checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+            Additional context information for debugging."""
+        if not self._sample_debug():
+            return None
+        return self._log(LEVEL_DEBUG, payload, transaction_id, checkpoint_id, extra)
+
+    def warning(self, payload: object, transaction_id: Optional[str] = None,
+                checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs a warning message.
 
         Parameters
         ----------
         payload : object
             The data or message to be logged.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             An identifier for the transaction, by default None.
         checkpoint_id : str, optional
             An identifier for the tracing checkpoint.
         extra : dict, optional
-            Additional context information for debugging.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method warning")
-
-    @abstractmethod
-    def error(self, payload: object, *args, transaction_id: Optional[str] = None,
-              checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+            Additional context information for debugging."""
+        return self._log(LEVEL_WARNING, payload, transaction_id, checkpoint_id, extra)
+
+    def error(self, payload: object, transaction_id: Optional[str] = None,
+              checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs an error message.
 
         Parameters
         ----------
         payload : object
             The data or message to be logged.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             An identifier for the transaction, by default None.
         checkpoint_id : str, optional
             An identifier for the tracing checkpoint.
         extra : dict, optional
-            Additional context information for debugging.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method error")
-
-    @abstractmethod
-    def critical(self, payload: object, *args, transaction_id: Optional[str] = None,
-                 checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+            Additional context information for debugging."""
+        return self._log(LEVEL_ERROR, payload, transaction_id, checkpoint_id, extra)
+
+    def critical(self, payload: object, transaction_id: Optional[str] = None,
+                 checkpoint_id: Optional[str] = None, extra: dict = None):
         """Logs a critical error message.
 
         Parameters
         ----------
         payload : object
             The data or message to be logged.
-        *args: tuple
-            Arguments
         transaction_id : Optional[str], optional
             An identifier for the transaction, by default None.
         checkpoint_id : str, optional
             An identifier for the tracing checkpoint.
         extra : dict, optional
-            Additional context information for debugging.
-        **kwargs: dict
-            Keyword arguments"""
-        raise NotImplementedError("TracingManager must implement method critical")
+            Additional context information for debugging."""
+        return self._log(LEVEL_CRITICAL, payload, transaction_id, checkpoint_id, extra)
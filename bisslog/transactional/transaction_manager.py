@@ -63,6 +63,19 @@ class TransactionManager(metaclass=SingletonReplaceAttrsMeta):
                 transactions_ids.append(Transaction(transaction_id, component))
         return transaction_id
 
+    def has_context(self) -> bool:
+        """Checks whether the current thread has an active transactional context.
+
+        This check is lock-free: it only performs a dictionary read, which is
+        atomic under CPython, so callers can use it to avoid the locked
+        lookups when no transaction exists at all.
+
+        Returns
+        -------
+        bool
+            True if the current thread has at least one open transaction."""
+        return bool(self._thread_active_transaction_mapping.get(threading.get_ident()))
+
     def get_transaction_id(self) -> str:
         """Retrieves the latest transaction ID associated with the current thread.
 
@@ -120,7 +120,8 @@ class BasicUseCase(UseCaseBase, TransactionTraceable, ABC):
         try:
             res = self.use(*args, transaction_id=transaction_id, **kwargs)
         except BaseException as error:
-            self.log.tech_error(transaction_id, "use-case-base-catcher", error=error)
+            self.log.tech_error(transaction_id, checkpoint_id="use-case-base-catcher",
+                                error=error)
             raise
         self.__end(transaction_id=transaction_id,
                    super_transaction_id=super_transaction_id, result=res)
@@ -34,4 +34,7 @@ def test_logging_methods(tracer, mock_logger, method, log_level):
 
     expected_extra = {"transaction_id": transaction_id, "checkpoint_id": checkpoint_id, **extra}
     log_method = getattr(mock_logger, log_level)
-    log_method.assert_called_once_with(payload, extra=expected_extra)
+    if method == "tech_error":
+        log_method.assert_called_once_with("%s%s", payload, "", extra=expected_extra)
+    else:
+        log_method.assert_called_once_with(payload, extra=expected_extra)
@@ -60,3 +60,25 @@ def test_exception_message():
     err_msg = "A test error occurred"
     with pytest.raises(ProcessingExtException, match=err_msg):
         raise ProcessingExtException(err_msg)
+
+
+def test_ext_operational_tuple_catches_operational_leaves():
+    """Tests that the flat operational tuple matches its concrete classes."""
+    from bisslog.exceptions.external_interactions_errors import EXT_OPERATIONAL
+
+    for cls in (ConnectionExtException, TimeoutExtException, AuthenticationExtException,
+                AuthorizationExtException, DeliveryExtException):
+        assert cls in EXT_OPERATIONAL
+        with pytest.raises(EXT_OPERATIONAL):
+            raise cls("boom")
+
+
+def test_ext_leaves_contains_only_leaf_classes():
+    """Tests that EXT_LEAVES holds every class without subclasses and no parent."""
+    from bisslog.exceptions.external_interactions_errors import EXT_LEAVES
+
+    assert ConnectionExtException in EXT_LEAVES
+    assert WarningExtException in EXT_LEAVES
+    assert OperationalErrorExtException not in EXT_LEAVES
+    assert ExternalInteractionError not in EXT_LEAVES
+    assert all(not cls.__subclasses__() for cls in EXT_LEAVES)
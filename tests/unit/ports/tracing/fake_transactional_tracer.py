@@ -7,39 +7,39 @@ mock_transaction_manager = MagicMock()
 
 class FakeTransactionalTracer(TransactionalTracer):
 
-    def info(self, payload: object, *args, transaction_id: Optional[str] = None,
-             checkpoint_id: Optional[str] = None, **kwargs):
+    def info(self, payload: object, transaction_id: Optional[str] = None,
+             checkpoint_id: Optional[str] = None):
         pass
 
-    def debug(self, payload: object, *args, transaction_id: Optional[str] = None,
-              checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def debug(self, payload: object, transaction_id: Optional[str] = None,
+              checkpoint_id: Optional[str] = None, extra: dict = None):
         pass
 
-    def warning(self, payload: object, *args, transaction_id: Optional[str] = None,
-                checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def warning(self, payload: object, transaction_id: Optional[str] = None,
+                checkpoint_id: Optional[str] = None, extra: dict = None):
         pass
 
-    def error(self, payload: object, *args, transaction_id: Optional[str] = None,
-              checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def error(self, payload: object, transaction_id: Optional[str] = None,
+              checkpoint_id: Optional[str] = None, extra: dict = None):
         pass
 
-    def critical(self, payload: object, *args, transaction_id: Optional[str] = None,
-                 checkpoint_id: Optional[str] = None, extra: dict = None, **kwargs):
+    def critical(self, payload: object, transaction_id: Optional[str] = None,
+                 checkpoint_id: Optional[str] = None, extra: dict = None):
         pass
 
-    def func_error(self, payload, *args, **kwargs):
+    def func_error(self, payload):
         pass
 
-    def tech_error(self, payload, *args, **kwargs):
+    def tech_error(self, payload):
         pass
 
-    def report_start_external(self, payload, *args, **kwargs):
+    def report_start_external(self, payload):
         pass
 
-    def report_end_external(self, payload, *args, **kwargs):
+    def report_end_external(self, payload):
         pass
 
     def __getattribute__(self, item):
-        if item == "_transaction_manager":
+        if item == "_tm":
             return mock_transaction_manager
         return super().__getattribute__(item)
@@ -0,0 +1,57 @@
+import time
+
+from bisslog.ports.tracing.buffered_sink import BufferedBatchHandler, BufferedSink
+
+
+def test_write_is_buffered_until_flush(tmp_path):
+    """Ensures bytes stay in the buffer until an explicit flush."""
+    path = tmp_path / "trace.log"
+    sink = BufferedSink(path=str(path), flush_interval=60.0)
+
+    sink.write(b"first line\n")
+    assert path.read_bytes() == b""
+
+    sink.flush()
+    assert path.read_bytes() == b"first line\n"
+    sink.close()
+
+
+def test_timed_flush_drains_buffer(tmp_path):
+    """Ensures the self-rescheduling timer flushes pending bytes."""
+    path = tmp_path / "trace.log"
+    sink = BufferedSink(path=str(path), flush_interval=0.05)
+
+    sink.write(b"timed\n")
+    time.sleep(0.3)
+
+    assert path.read_bytes() == b"timed\n"
+    sink.close()
+
+
+def test_close_flushes_and_releases(tmp_path):
+    """Ensures close flushes remaining bytes and closes the owned file."""
+    path = tmp_path / "trace.log"
+    sink = BufferedSink(path=str(path), flush_interval=60.0)
+
+    sink.write(b"closing\n")
+    sink.close()
+
+    assert path.read_bytes() == b"closing\n"
+
+
+def test_batch_handler_prefixes_timestamps_with_second_cache(tmp_path):
+    """Ensures the batch handler renders nanosecond timestamps per second."""
+    path = tmp_path / "trace.log"
+    sink = BufferedSink(path=str(path), flush_interval=60.0)
+    handler = BufferedBatchHandler(sink)
+
+    same_sec = time.strftime("%Y-%m-%d %H:%M:%S ", time.localtime(7)).encode("ascii")
+    next_sec = time.strftime("%Y-%m-%d %H:%M:%S ", time.localtime(8)).encode("ascii")
+    handler.handle_batch([(7_000_000_000, b"first\n"),
+                          (7_500_000_000, b"second\n"),
+                          (8_000_000_000, b"third\n")])
+    sink.flush()
+
+    assert path.read_bytes() == (same_sec + b"first\n" + same_sec + b"second\n"
+                                 + next_sec + b"third\n")
+    sink.close()
@@ -0,0 +1,214 @@
+import collections
+import json
+import threading
+import time
+
+import pytest
+
+from bisslog.ports.tracing import _dispatcher
+from bisslog.ports.tracing.log_queue import QueueListener
+from bisslog.ports.tracing.service_tracer import ServiceTracer
+from bisslog.ports.tracing.tracer import LEVEL_INFO
+
+
+class RecordingHandler:
+    """Test handler storing the batches it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    def handle_batch(self, records):
+        self.batches.append(list(records))
+
+
+class RecordingWriter:
+    """Test writer storing the bytes it receives."""
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, data):
+        self.written.append(data)
+
+
+@pytest.fixture
+def recording_handler(monkeypatch):
+    """Redirects the shared buffer to a fresh listener with a recording handler."""
+    handler = RecordingHandler()
+    fresh_buf = collections.deque()
+    fresh_wake = threading.Event()
+    listener = QueueListener(fresh_buf, fresh_wake, handler)
+    monkeypatch.setattr(_dispatcher, "_buf", fresh_buf)
+    monkeypatch.setattr(_dispatcher, "_wake", fresh_wake)
+    monkeypatch.setattr(_dispatcher, "_listener", listener)
+    listener.start()
+    yield handler
+    listener.stop()
+
+
+def test_listener_drains_records_in_order(recording_handler):
+    """Ensures buffered records reach the handler in FIFO order."""
+    for i in range(5):
+        assert _dispatcher.enqueue(("default", i, b"line\n"))
+    _dispatcher._listener.stop()
+
+    flattened = [record for batch in recording_handler.batches for record in batch]
+    assert [ts for _, ts, _ in flattened] == list(range(5))
+
+
+def test_listener_survives_raising_handler():
+    """Ensures a raising sink handler does not kill the consumer thread."""
+    class FlakyHandler:
+        def __init__(self):
+            self.batches = []
+            self.fail_next = True
+
+        def handle_batch(self, records):
+            if self.fail_next:
+                self.fail_next = False
+                raise OSError("sink failed")
+            self.batches.append(list(records))
+
+    handler = FlakyHandler()
+    buf = collections.deque()
+    wake = threading.Event()
+    listener = QueueListener(buf, wake, handler)
+    listener.start()
+
+    buf.append(("default", 1, b"boom\n"))
+    wake.set()
+    time.sleep(0.05)
+    buf.append(("default", 2, b"ok\n"))
+    wake.set()
+    listener.stop()
+
+    flattened = [record for batch in handler.batches for record in batch]
+    assert [ts for _, ts, _ in flattened] == [2]
+
+
+def test_enqueue_drops_when_full(monkeypatch):
+    """Ensures enqueue drops records instead of blocking when the buffer is full."""
+    tiny_buf = collections.deque()
+    tiny_wake = threading.Event()
+    monkeypatch.setattr(_dispatcher, "_buf", tiny_buf)
+    monkeypatch.setattr(_dispatcher, "_wake", tiny_wake)
+    monkeypatch.setattr(_dispatcher, "_listener",
+                        QueueListener(tiny_buf, tiny_wake, RecordingHandler()))
+    monkeypatch.setattr(_dispatcher, "_BUF_MAXLEN", 1)
+    monkeypatch.setattr(_dispatcher, "_dropped_records", 0)
+
+    assert _dispatcher.enqueue(("default", 1, b"kept\n"))
+    assert not _dispatcher.enqueue(("default", 2, b"dropped\n"))
+    assert _dispatcher._dropped_records == 1
+
+
+def test_dispatch_routes_batches_by_sink_name(monkeypatch):
+    """Ensures tagged records reach their registered sink, others the default."""
+    default_writer = RecordingWriter()
+    named_writer = RecordingWriter()
+    sinks = {}
+    monkeypatch.setattr(_dispatcher, "_sinks", sinks)
+    _dispatcher.register_sink(_dispatcher.DEFAULT_SINK, default_writer)
+    _dispatcher.register_sink("named", named_writer)
+
+    _dispatcher._DispatchHandler().handle_batch([
+        ("named", 1_000_000_000, b"to named\n"),
+        ("unregistered", 1_000_000_000, b"to default\n"),
+        ("named", 1_000_000_000, b"to named again\n"),
+    ])
+
+    assert len(named_writer.written) == 1
+    assert b"to named\n" in named_writer.written[0]
+    assert b"to named again\n" in named_writer.written[0]
+    assert len(default_writer.written) == 1
+    assert b"to default\n" in default_writer.written[0]
+
+
+def test_register_sink_first_registration_wins(monkeypatch):
+    """Ensures repeated registrations under one name keep the first writer."""
+    sinks = {}
+    monkeypatch.setattr(_dispatcher, "_sinks", sinks)
+    first = RecordingWriter()
+
+    _dispatcher.register_sink("named", first)
+    _dispatcher.register_sink("named", RecordingWriter())
+
+    assert sinks["named"]._sink is first
+
+
+def test_service_tracer_enqueues_record(monkeypatch):
+    """Ensures the default ServiceTracer methods enqueue a tagged record."""
+    captured = []
+    monkeypatch.setattr(_dispatcher, "enqueue", captured.append)
+
+    ServiceTracer().info("Info message", checkpoint_id="checkpoint-1")
+
+    assert len(captured) == 1
+    sink_name, _, line = captured[0]
+    record = json.loads(line)
+    assert sink_name == "ServiceTracer"
+    assert record["lvl"] == LEVEL_INFO
+    assert record["p"] == "Info message"
+    assert record["ckpt"] == "checkpoint-1"
+
+
+def test_service_tracer_debug_sampling(monkeypatch):
+    """Ensures the debug sampling mask drops records at the producer."""
+    captured = []
+    monkeypatch.setattr(_dispatcher, "enqueue", captured.append)
+    class SampledTracer(ServiceTracer):
+        __slots__ = ()
+        _dbg_sample_mask = 3
+
+    tracer = SampledTracer()
+
+    for i in range(8):
+        tracer.debug(i)
+
+    assert [json.loads(line)["p"] for _, _, line in captured] == [3, 7]
+
+
+def test_rate_limit_caps_burst(monkeypatch):
+    """Ensures the token bucket stops admitting records once drained."""
+    captured = []
+    monkeypatch.setattr(_dispatcher, "enqueue", captured.append)
+    class LimitedTracer(ServiceTracer):
+        __slots__ = ()
+        _rate_limit = 0.0
+        _rate_burst = 3.0
+
+    tracer = LimitedTracer()
+
+    for i in range(10):
+        tracer.info(f"msg-{i}")
+
+    assert len(captured) == 3
+
+
+def test_duplicate_suppression(monkeypatch):
+    """Ensures identical records within the window are collapsed."""
+    captured = []
+    monkeypatch.setattr(_dispatcher, "enqueue", captured.append)
+    tracer = ServiceTracer()
+
+    tracer.info("same message", checkpoint_id="cp-1")
+    tracer.info("same message", checkpoint_id="cp-1")
+    tracer.info("other message", checkpoint_id="cp-1")
+
+    assert [json.loads(line)["p"]
+            for _, _, line in captured] == ["same message", "other message"]
+
+
+def test_distinct_structured_payloads_are_not_deduplicated(monkeypatch):
+    """Ensures dedup never collapses distinct dict or list payloads."""
+    captured = []
+    monkeypatch.setattr(_dispatcher, "enqueue", captured.append)
+    tracer = ServiceTracer()
+
+    tracer.info({"a": 1}, checkpoint_id="cp-1")
+    tracer.info({"b": 2}, checkpoint_id="cp-1")
+    tracer.info([1], checkpoint_id="cp-1")
+    tracer.info([2], checkpoint_id="cp-1")
+
+    assert [json.loads(line)["p"]
+            for _, _, line in captured] == [{"a": 1}, {"b": 2}, [1], [2]]
@@ -11,8 +11,8 @@ def transactional_tracer():
 
 def test_re_args_with_main(transactional_tracer):
     """Test that _re_args_with_main returns expected dictionary."""
-    transactional_tracer._transaction_manager.get_main_transaction_id = MagicMock()
-    transactional_tracer._transaction_manager.get_main_transaction_id.return_value = "1234-5678"
+    transactional_tracer._tm.get_main_transaction_id = MagicMock()
+    transactional_tracer._tm.get_main_transaction_id.return_value = "1234-5678"
 
     result = transactional_tracer._re_args_with_main()
 
@@ -21,9 +21,64 @@ def test_re_args_with_main(transactional_tracer):
 
 def test_re_args_with_current(transactional_tracer):
     """Test that _re_args_with_current returns expected dictionary."""
-    transactional_tracer._transaction_manager.get_transaction_id = MagicMock()
-    transactional_tracer._transaction_manager.get_transaction_id.return_value = "8765-4321"
+    transactional_tracer._tm.get_transaction_id = MagicMock()
+    transactional_tracer._tm.get_transaction_id.return_value = "8765-4321"
 
     result = transactional_tracer._re_args_with_current()
 
     assert result == {"transaction_id": "8765-4321", "checkpoint_id": ""}
+
+
+def test_re_args_with_current_reuses_cached_dict(transactional_tracer):
+    """Test that repeated calls with the same transaction reuse the cached dict."""
+    transactional_tracer._tm.get_transaction_id = MagicMock()
+    transactional_tracer._tm.get_transaction_id.return_value = "8765-4321"
+
+    first = transactional_tracer._re_args_with_current()
+    second = transactional_tracer._re_args_with_current()
+
+    assert first is second
+
+
+def test_re_args_with_current_rebuilds_on_new_checkpoint(transactional_tracer):
+    """Test that a different checkpoint id produces a new dictionary."""
+    transactional_tracer._tm.get_transaction_id = MagicMock()
+    transactional_tracer._tm.get_transaction_id.return_value = "8765-4321"
+
+    first = transactional_tracer._re_args_with_current()
+    second = transactional_tracer._re_args_with_current(checkpoint_id="checkpoint-1")
+
+    assert first is not second
+    assert second == {"transaction_id": "8765-4321", "checkpoint_id": "checkpoint-1"}
+
+
+def test_fmt_subclass_gets_specialized_log():
+    """Test that a subclass declaring _FMT writes formatted bytes to its sink."""
+    from bisslog.ports.tracing.transactional_tracer import TransactionalTracer
+
+    class SinkTracer(TransactionalTracer):
+        _FMT = "%(lvl)s %(tid)s %(ckpt)s %(p)s\n"
+
+        def __init__(self, sink):
+            super().__init__()
+            self._sink = sink
+
+    written = []
+
+    class FakeSink:
+        def write(self, data):
+            written.append(data)
+
+    tracer = SinkTracer(FakeSink())
+    tracer.info("payload text", transaction_id="tx-1", checkpoint_id="cp-1")
+
+    assert written == [b"20 tx-1 cp-1 payload text\n"]
+
+
+def test_tracer_instances_have_no_dict():
+    """Test that the slotted tracer bases produce __dict__-free instances."""
+    from bisslog.ports.tracing.service_tracer import ServiceTracer
+    from bisslog.ports.tracing.transactional_tracer import TransactionalTracer
+
+    assert not hasattr(ServiceTracer(), "__dict__")
+    assert not hasattr(TransactionalTracer(), "__dict__")
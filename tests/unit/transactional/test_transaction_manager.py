@@ -88,3 +88,16 @@ def test_close_transaction():
     with pytest.raises(KeyError, match="Transaction ID not found in cache"):
         transaction_manager.get_transaction_id()
     transaction_manager.clear()
+
+
+def test_has_context():
+    """Tests that has_context reflects whether the thread holds transactions."""
+    transaction_manager.clear()
+
+    assert not transaction_manager.has_context()
+
+    transaction_manager.create_transaction_id("component-a")
+    assert transaction_manager.has_context()
+
+    transaction_manager.close_transaction()
+    assert not transaction_manager.has_context()